@@ -2,23 +2,232 @@
 """
 TeamCache Manager API Client
 A comprehensive Python client for interacting with the TeamCache Manager API.
+
+Requires Python 3.11+ and:
+    pip install httpx orjson "websockets>=13"
+
+Optional packages, used when installed:
+    h2      - HTTP/2 connections
+    brotli  - brotli-compressed responses
+    scipy   - job polling placed from past job durations
+    uvloop  - faster asyncio event loop
 """
 
-import requests
+import httpx
 import json
+import orjson
+import os
 import time
+import random
+import sys
+import tempfile
+import threading
 import asyncio
 import websockets
-from typing import List, Dict, Optional, Any
-from datetime import datetime
+from websockets.asyncio.client import connect as websocket_connect
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Optional, Any, Set
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
+try:
+    from scipy import stats
+except ImportError:  # Adaptive poll placement is optional
+    stats = None
 
-class TeamCacheClient:
-    """Client for TeamCache Manager API"""
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401 - lets httpx decode br responses
+    _ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
+
+# Job statuses after which a job no longer changes
+_TERMINAL_STATUSES = frozenset(("completed", "failed", "cancelled"))
+
+# Largest page size the API will return
+_MAX_PAGE_SIZE = 100
+
+# The API allows 10 job requests per minute per client, so never poll a
+# job faster than every 6 seconds
+_JOB_REQUESTS_PER_MINUTE = 10
+_MIN_POLL_INTERVAL = 60.0 / _JOB_REQUESTS_PER_MINUTE
+_MAX_POLL_INTERVAL = 30.0
+
+# Polls placed using the job duration model before falling back to backoff
+_POLL_BUDGET = 10
+
+# Most jobs monitored at once when a batch is submitted directory by directory
+_MAX_CONCURRENT_JOBS = 4
+
+
+def _json(response: httpx.Response) -> Any:
+    """Decode a JSON response body"""
+    return orjson.loads(response.content)
+
+
+def _retry_after_seconds(response: Optional[httpx.Response]) -> Optional[float]:
+    """Return the server's Retry-After delay in seconds, if it sent one"""
+    if response is None or response.status_code not in (429, 503):
+        return None
     
-    def __init__(self, api_url: str = "http://localhost:8095", api_key: str = "demo-api-key-2024"):
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    # Retry-After may also be an HTTP-date
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(retry_after: float, minimum: float) -> float:
+    """Wait before retrying, jittered so concurrent requests don't retry in lockstep"""
+    delay = max(retry_after, minimum)
+    return delay + random.uniform(0, delay * 0.1)
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp as returned by the API"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class JobDurationModel:
+    """
+    History of job completion times used to place status polls.
+    
+    Durations are grouped into power-of-two job size buckets. For a bucket
+    with enough history a lognormal distribution is fitted and poll times
+    are chosen to minimize the expected delay between a job finishing and
+    the client noticing, for a fixed number of polls. Requires scipy;
+    without it (or without enough history) no schedule is produced.
+    """
+    
+    MIN_SAMPLES = 5
+    MAX_SAMPLES = 200
+    
+    def __init__(self, history_path: str = "~/.teamcache/poll_hist.json"):
         """
-        Initialize the TeamCache client.
+        Initialize the model.
+        
+        Args:
+            history_path: JSON file used to persist durations across runs
+        """
+        self.history_path = os.path.expanduser(history_path)
+        self.history: Dict[str, List[float]] = self._load()
+        # Jobs monitored on several threads can record at the same time
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _bucket(size: int) -> str:
+        """Size bucket key for a job of the given size in bytes"""
+        return str(max(int(size), 1).bit_length())
+    
+    def _load(self) -> Dict[str, List[float]]:
+        """Load persisted history, starting empty if there is none"""
+        try:
+            with open(self.history_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save(self):
+        """Persist history to disk, replacing the file atomically"""
+        directory = os.path.dirname(self.history_path)
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as f:
+            json.dump(self.history, f)
+        os.replace(f.name, self.history_path)
+    
+    def record(self, size: int, duration: float):
+        """
+        Record the duration of a completed job.
+        
+        Args:
+            size: Total job size in bytes
+            duration: Seconds from job creation to completion
+        """
+        if duration <= 0:
+            return
+        
+        with self._lock:
+            samples = self.history.setdefault(self._bucket(size), [])
+            samples.append(duration)
+            del samples[:-self.MAX_SAMPLES]
+            self._save()
+    
+    def poll_times(self, size: int, budget: int = 10) -> List[float]:
+        """
+        Compute poll times for a job.
+        
+        Each time L_i follows from the previous two as
+        L_i = L_{i-1} + (F(L_{i-1}) - F(L_{i-2})) / p(L_{i-1}), with L_0 = 0.
+        The first poll is chosen so that the last one lands on the 99th
+        percentile of the fitted distribution.
+        
+        Args:
+            size: Total job size in bytes
+            budget: Number of polls to place
+            
+        Returns:
+            Poll times in seconds from job creation, or an empty list if
+            no schedule can be computed
+        """
+        with self._lock:
+            samples = list(self.history.get(self._bucket(size), []))
+        if stats is None or budget < 1 or len(samples) < self.MIN_SAMPLES:
+            return []
+        
+        shape, loc, scale = stats.lognorm.fit(samples, floc=0)
+        dist = stats.lognorm(shape, loc=loc, scale=scale)
+        horizon = dist.ppf(0.99)
+        
+        def schedule(first: float) -> List[float]:
+            times = [first]
+            previous = 0.0
+            while len(times) < budget:
+                current = times[-1]
+                density = dist.pdf(current)
+                if density <= 0:
+                    break
+                mass = dist.cdf(current) - dist.cdf(previous)
+                times.append(current + mass / density)
+                previous = current
+            return times
+        
+        # The last poll time grows with the first, so bisect on the first
+        low, high = 0.0, horizon
+        for _ in range(50):
+            mid = (low + high) / 2
+            if schedule(mid)[-1] < horizon:
+                low = mid
+            else:
+                high = mid
+        
+        return [float(t) for t in schedule(high)]
+
+
+class _ClientBase:
+    """Endpoint URLs and connection settings for the sync and async clients"""
+    
+    def __init__(self, api_url: str, api_key: str):
+        """
+        Initialize the shared client state.
         
         Args:
             api_url: Base URL of the API server
@@ -26,17 +235,80 @@ class TeamCacheClient:
         """
         self.api_url = api_url.rstrip('/')
         self.api_key = api_key
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._health_url = f"{self.api_url}/api/v1/health"
+        self._metrics_url = f"{self.api_url}/api/v1/metrics"
+        self._s3_metrics_url = f"{self.api_url}/api/v1/metrics/s3"
+        self._jobs_url = f"{self.api_url}/api/v1/cache/jobs"
+        self._job_url_prefix = self._jobs_url + "/"
+        self._headers = {
             "X-API-Key": api_key,
-            "Content-Type": "application/json"
-        })
+            "Content-Type": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING
+        }
+        self._limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    
+    @staticmethod
+    def _job_body(files: Optional[List[str]],
+                  directories: Optional[List[str]],
+                  recursive: bool) -> bytes:
+        """Encode the request body for a new cache job"""
+        if not files and not directories:
+            raise ValueError("Must provide either files or directories")
+        
+        data = {"recursive": recursive}
+        if files:
+            data["files"] = files
+        if directories:
+            data["directories"] = directories
+        return orjson.dumps(data)
+    
+    @staticmethod
+    def _list_params(page: int, limit: int, status: Optional[str]) -> Dict[str, Any]:
+        """Query parameters for listing jobs"""
+        # The API pages by offset
+        params = {"limit": limit, "offset": (page - 1) * limit}
+        if status:
+            params["status"] = status
+        return params
+
+
+class TeamCacheClient(_ClientBase):
+    """Client for TeamCache Manager API"""
+    
+    def __init__(self,
+                 api_url: str = "http://localhost:8095",
+                 api_key: str = "demo-api-key-2024",
+                 duration_model: Optional[JobDurationModel] = None):
+        """
+        Initialize the TeamCache client.
+        
+        Args:
+            api_url: Base URL of the API server
+            api_key: API key for authentication
+            duration_model: Optional job duration history for adaptive polling
+        """
+        super().__init__(api_url, api_key)
+        self.duration_model = duration_model
+        self._print_lock = threading.Lock()
+        self._last_progress_str = None
+        # One stop event per monitoring run in progress
+        self._stop_events: Set[threading.Event] = set()
+        self._stop_lock = threading.Lock()
+        # HTTP/2 lets concurrent requests share one connection where the
+        # server negotiates it; job creation scans directories on the
+        # server and can take a while, so requests don't time out
+        self.session = httpx.Client(
+            http2=_HTTP2_AVAILABLE,
+            headers=self._headers,
+            limits=self._limits,
+            timeout=None
+        )
     
     def health_check(self) -> Dict[str, Any]:
         """Check API server health status"""
-        response = self.session.get(f"{self.api_url}/api/v1/health")
+        response = self.session.get(self._health_url)
         response.raise_for_status()
-        return response.json()
+        return _json(response)
     
     def create_cache_job(self, 
                         files: Optional[List[str]] = None,
@@ -53,21 +325,12 @@ class TeamCacheClient:
         Returns:
             Job creation response with job ID and details
         """
-        if not files and not directories:
-            raise ValueError("Must provide either files or directories")
-        
-        data = {"recursive": recursive}
-        if files:
-            data["files"] = files
-        if directories:
-            data["directories"] = directories
-        
         response = self.session.post(
-            f"{self.api_url}/api/v1/cache/jobs",
-            json=data
+            self._jobs_url,
+            content=self._job_body(files, directories, recursive)
         )
         response.raise_for_status()
-        return response.json()
+        return _json(response)
     
     def get_job_status(self, job_id: str) -> Dict[str, Any]:
         """
@@ -79,9 +342,9 @@ class TeamCacheClient:
         Returns:
             Job status and progress information
         """
-        response = self.session.get(f"{self.api_url}/api/v1/cache/jobs/{job_id}")
+        response = self.session.get(self._job_url_prefix + job_id)
         response.raise_for_status()
-        return response.json()
+        return _json(response)
     
     def list_jobs(self, 
                   page: int = 1, 
@@ -98,16 +361,47 @@ class TeamCacheClient:
         Returns:
             Paginated list of jobs
         """
-        params = {"page": page, "limit": limit}
-        if status:
-            params["status"] = status
-        
         response = self.session.get(
-            f"{self.api_url}/api/v1/cache/jobs",
-            params=params
+            self._jobs_url,
+            params=self._list_params(page, limit, status)
         )
         response.raise_for_status()
-        return response.json()
+        return _json(response)
+    
+    def iter_jobs(self,
+                  status: Optional[str] = None,
+                  limit: int = _MAX_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all cache jobs, page by page.
+        
+        The next page is fetched in the background while the jobs of the
+        current page are being consumed.
+        
+        Args:
+            status: Filter by job status
+            limit: Jobs per page (capped at 100 by the API)
+            
+        Yields:
+            Jobs, newest first
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        limit = min(limit, _MAX_PAGE_SIZE)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page_number = 1
+            page = self.list_jobs(page=page_number, limit=limit, status=status)
+            
+            while True:
+                jobs = page["jobs"]
+                if len(jobs) < limit:
+                    yield from jobs
+                    return
+                
+                next_page = executor.submit(self.list_jobs, page_number + 1, limit, status)
+                yield from jobs
+                page = next_page.result()
+                page_number += 1
     
     def cancel_job(self, job_id: str) -> Dict[str, Any]:
         """
@@ -119,61 +413,187 @@ class TeamCacheClient:
         Returns:
             Cancellation confirmation
         """
-        response = self.session.delete(f"{self.api_url}/api/v1/cache/jobs/{job_id}")
+        response = self.session.delete(self._job_url_prefix + job_id)
         response.raise_for_status()
-        return response.json()
+        return _json(response)
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current system metrics including LucidLink and S3 health"""
-        response = requests.get(f"{self.api_url}/api/v1/metrics")
+        response = self.session.get(self._metrics_url)
         response.raise_for_status()
-        return response.json()
+        return _json(response)
     
     def get_s3_metrics(self) -> Dict[str, Any]:
         """Get detailed S3 health metrics with history"""
-        response = requests.get(f"{self.api_url}/api/v1/metrics/s3")
+        response = self.session.get(self._s3_metrics_url)
         response.raise_for_status()
-        return response.json()
+        return _json(response)
     
     def monitor_job(self, 
                    job_id: str, 
-                   interval: int = 5,
-                   callback: Optional[callable] = None) -> Dict[str, Any]:
+                   base_interval: float = _MIN_POLL_INTERVAL,
+                   callback: Optional[callable] = None,
+                   max_interval: float = _MAX_POLL_INTERVAL,
+                   poll_budget: int = _POLL_BUDGET,
+                   interval: Optional[float] = None) -> Dict[str, Any]:
         """
         Monitor a job until completion.
         
+        If the client has a duration model with enough history for jobs of
+        this size, the first poll_budget polls are placed according to it,
+        measured from the job's creation time and never closer together
+        than base_interval. Otherwise, and once that schedule is used up,
+        polling starts at base_interval and doubles (with a little jitter)
+        while the job's progress is unchanged, up to max_interval. The
+        interval resets as soon as progress advances. A Retry-After header
+        on a rate-limited response takes precedence over both, but the wait
+        is never shorter than base_interval. Waits between polls end early
+        when stop() is called.
+        
         Args:
             job_id: The job ID to monitor
-            interval: Seconds between status checks
+            base_interval: Seconds between status checks while progressing
             callback: Optional callback function for progress updates
+            max_interval: Upper bound in seconds for the backoff interval
+            poll_budget: Number of polls to place using the duration model
+            interval: Deprecated alias for base_interval
             
         Returns:
-            Final job status
+            Final job status, or the last status seen (None if there was
+            none yet) if monitoring was stopped
         """
+        if interval is not None:
+            base_interval = interval
+        
+        with self._monitoring_run() as stop_event:
+            return self._monitor_job(job_id, stop_event, base_interval, callback,
+                                     max_interval, poll_budget)
+    
+    def _monitor_job(self,
+                     job_id: str,
+                     stop_event: threading.Event,
+                     base_interval: float = _MIN_POLL_INTERVAL,
+                     callback: Optional[callable] = None,
+                     max_interval: float = _MAX_POLL_INTERVAL,
+                     poll_budget: int = _POLL_BUDGET) -> Dict[str, Any]:
+        """Monitor a job until completion or until stop_event is set"""
+        job = None
+        backoff = base_interval
+        last_percentage = None
+        started = time.monotonic()
+        created_at = None
+        poll_times = None
+        self._last_progress_str = None
+        
         while True:
-            status = self.get_job_status(job_id)
+            try:
+                status = self.get_job_status(job_id)
+            except httpx.HTTPStatusError as e:
+                retry_after = _retry_after_seconds(e.response)
+                if retry_after is None:
+                    raise
+                # A zero or already past Retry-After must not turn into a busy loop
+                if stop_event.wait(_retry_delay(retry_after, base_interval)):
+                    return job
+                continue
+            
             job = status["job"]
             
+            if poll_times is None:
+                created_at = _parse_timestamp(job.get("createdAt"))
+                poll_times = iter(self._poll_times(job, poll_budget))
+            
             # Call callback if provided
             if callback:
                 callback(job)
             else:
-                # Default progress display
-                progress = job["progress"]
-                print(f"\rProgress: {progress['size']['completedReadable']} / "
-                      f"{progress['size']['totalReadable']} "
-                      f"({progress['size']['percentage']}%)", end="", flush=True)
+                # Default progress display, only redrawn when it changes
+                size = job["progress"]["size"]
+                progress_str = (f"\rProgress: {size['completedReadable']} / "
+                                f"{size['totalReadable']} ({size['percentage']}%)")
+                if progress_str != self._last_progress_str:
+                    self._last_progress_str = progress_str
+                    sys.stdout.write(progress_str)
+                    sys.stdout.flush()
             
             # Check if job is complete
-            if job["status"] in ["completed", "failed", "cancelled"]:
-                print()  # New line after progress
+            if job["status"] in _TERMINAL_STATUSES:
+                if not callback:
+                    print()  # New line after progress
+                if job["status"] == "completed":
+                    self._record_duration(job)
                 return job
             
-            time.sleep(interval)
+            # Back off while the job is idle, reset once it moves again
+            percentage = job["progress"]["size"]["percentage"]
+            if percentage != last_percentage:
+                backoff = base_interval
+            else:
+                backoff = min(backoff * 2, max_interval)
+            last_percentage = percentage
+            
+            # The schedule is relative to job creation; skip points that have
+            # passed or would come sooner than base_interval from now
+            if created_at:
+                elapsed = (datetime.now(timezone.utc) - created_at).total_seconds()
+            else:
+                elapsed = time.monotonic() - started
+            next_poll = next((t for t in poll_times if t >= elapsed + base_interval), None)
+            if next_poll is not None:
+                delay = next_poll - elapsed
+            else:
+                delay = backoff + random.uniform(0, backoff * 0.1)
+            
+            if stop_event.wait(delay):
+                return job
+    
+    def stop(self):
+        """Stop the monitoring runs in progress at their next wait"""
+        with self._stop_lock:
+            for stop_event in self._stop_events:
+                stop_event.set()
+    
+    @contextmanager
+    def _monitoring_run(self) -> Iterator[threading.Event]:
+        """Register a stop event for one monitoring run"""
+        stop_event = threading.Event()
+        with self._stop_lock:
+            self._stop_events.add(stop_event)
+        try:
+            yield stop_event
+        finally:
+            with self._stop_lock:
+                self._stop_events.discard(stop_event)
+    
+    def _poll_times(self, job: Dict[str, Any], budget: int) -> List[float]:
+        """Poll schedule for a job from the duration model, if any"""
+        if not self.duration_model:
+            return []
+        return self.duration_model.poll_times(job["progress"]["size"]["totalBytes"], budget)
+    
+    def _record_duration(self, job: Dict[str, Any]):
+        """Add a completed job's duration to the duration model"""
+        if not self.duration_model:
+            return
+        
+        created_at = _parse_timestamp(job.get("createdAt"))
+        completed_at = _parse_timestamp(job.get("completedAt"))
+        if created_at and completed_at:
+            self.duration_model.record(
+                job["progress"]["size"]["totalBytes"],
+                (completed_at - created_at).total_seconds()
+            )
     
     def batch_cache_directories(self, directories: List[str], monitor: bool = True) -> List[str]:
         """
-        Submit multiple directories as separate cache jobs.
+        Submit multiple directories as a single cache job.
+        
+        If the API rejects the combined job (for example because one of the
+        directories cannot be found), each directory is submitted as a
+        separate job instead. Those jobs share the API's rate limit, so only
+        a few are monitored at a time and each is polled less often.
+        Rate-limited submissions are retried after the server's Retry-After
+        delay.
         
         Args:
             directories: List of directory paths to cache
@@ -182,44 +602,202 @@ class TeamCacheClient:
         Returns:
             List of job IDs
         """
-        job_ids = []
-        
-        for directory in directories:
+        with self._monitoring_run() as stop_event:
             try:
-                print(f"Submitting job for: {directory}")
-                result = self.create_cache_job(directories=[directory])
-                job_id = result["jobId"]
-                job_ids.append(job_id)
-                print(f"  Created job: {job_id}")
-                print(f"  Files: {result['totalFiles']}")
-                print(f"  Size: {result['totalSize']['readable']}")
-                
-                if monitor:
-                    print("  Monitoring progress...")
-                    final_status = self.monitor_job(job_id)
-                    print(f"  Final status: {final_status['status']}")
+                job_id = self._submit_and_monitor(directories, monitor, stop_event)
+                return [job_id] if job_id else []
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                # Rate limiting applies to every job, so don't retry one by one
+                if not 400 <= status_code < 500 or status_code == 429:
+                    self._log(f"  Error: {e}")
+                    return []
+                self._log(f"  Batch rejected ({status_code}), submitting directories separately")
+            except Exception as e:
+                self._log(f"  Error: {e}")
+                return []
+            
+            # Submit and monitor each directory concurrently. All jobs share
+            # the per-client rate limit, so each one polls less often the
+            # more of them are monitored at once
+            job_ids = []
+            max_workers = min(_MAX_CONCURRENT_JOBS, len(directories))
+            interval = max_workers * _MIN_POLL_INTERVAL
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._submit_and_monitor, [directory], monitor,
+                                    stop_event, True, interval)
+                    for directory in directories
+                ]
+                try:
+                    for future in futures:
+                        try:
+                            job_id = future.result()
+                            if job_id:
+                                job_ids.append(job_id)
+                        except Exception as e:
+                            self._log(f"  Error: {e}")
+                except KeyboardInterrupt:
+                    # Let the monitoring threads finish so the pool can shut down
+                    stop_event.set()
+                    raise
+            
+            return job_ids
+    
+    def _submit_and_monitor(self,
+                            directories: List[str],
+                            monitor: bool,
+                            stop_event: threading.Event,
+                            concurrent: bool = False,
+                            base_interval: float = _MIN_POLL_INTERVAL) -> Optional[str]:
+        """
+        Submit a cache job for the given directories and optionally monitor it.
+        
+        Args:
+            directories: List of directory paths to cache
+            monitor: Whether to monitor the job until completion
+            stop_event: Event that ends monitoring when set
+            concurrent: Whether other jobs are being monitored at the same time
+            base_interval: Seconds between status checks while progressing
+            
+        Returns:
+            Job ID, or None if stopped before the job could be created
+        """
+        prefix = f"  [{directories[0]}] " if concurrent else "  "
+        
+        self._log(f"Submitting job for: {', '.join(directories)}")
+        result = self._create_job(directories, stop_event, prefix)
+        if result is None:
+            return None
+        job_id = result["jobId"]
+        self._log(f"{prefix}Created job: {job_id}")
+        self._log(f"{prefix}Files: {result['totalFiles']}")
+        self._log(f"{prefix}Size: {result['totalSize']['readable']}")
+        
+        if monitor:
+            callback = None
+            if concurrent:
+                # Concurrent jobs can't share a single in-place progress line
+                last_percentage = None
                 
+                def callback(job):
+                    nonlocal last_percentage
+                    percentage = job["progress"]["size"]["percentage"]
+                    if percentage != last_percentage:
+                        last_percentage = percentage
+                        self._log(f"{prefix}Progress: {percentage}%")
+            
+            try:
+                self._log(f"{prefix}Monitoring progress...")
+                final_status = self._monitor_job(job_id, stop_event, base_interval, callback,
+                                                 max(base_interval, _MAX_POLL_INTERVAL))
+                self._log(f"{prefix}Final status: {final_status['status']}")
             except Exception as e:
-                print(f"  Error: {e}")
+                self._log(f"{prefix}Error: {e}")
         
-        return job_ids
+        return job_id
+    
+    def _create_job(self,
+                    directories: List[str],
+                    stop_event: threading.Event,
+                    prefix: str = "  ") -> Optional[Dict[str, Any]]:
+        """Create a cache job, waiting out rate limiting until stop_event is set"""
+        while True:
+            try:
+                return self.create_cache_job(directories=directories)
+            except httpx.HTTPStatusError as e:
+                # A rate-limited request never reached the job handler, so
+                # it is safe to send again
+                retry_after = _retry_after_seconds(e.response)
+                if e.response.status_code != 429 or retry_after is None:
+                    raise
+                delay = _retry_delay(retry_after, _MIN_POLL_INTERVAL)
+                self._log(f"{prefix}Rate limited, retrying in {delay:.0f}s")
+                if stop_event.wait(delay):
+                    return None
+    
+    def _log(self, message: str):
+        """Print a line without interleaving output from other threads"""
+        with self._print_lock:
+            print(message)
+
+
+class AsyncTeamCacheClient(_ClientBase):
+    """
+    Asyncio client for TeamCache Manager API.
+    
+    Covers the read-only status endpoints so they can be queried
+    concurrently; use TeamCacheClient for jobs.
+    """
+    
+    def __init__(self, api_url: str = "http://localhost:8095", api_key: str = "demo-api-key-2024"):
+        """
+        Initialize the async TeamCache client.
+        
+        Args:
+            api_url: Base URL of the API server
+            api_key: API key for authentication
+        """
+        super().__init__(api_url, api_key)
+        self.session = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            headers=self._headers,
+            limits=self._limits,
+            timeout=None
+        )
+    
+    async def __aenter__(self) -> "AsyncTeamCacheClient":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the underlying connections"""
+        await self.session.aclose()
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Check API server health status"""
+        response = await self.session.get(self._health_url)
+        response.raise_for_status()
+        return _json(response)
+    
+    async def get_metrics(self) -> Dict[str, Any]:
+        """Get current system metrics including LucidLink and S3 health"""
+        response = await self.session.get(self._metrics_url)
+        response.raise_for_status()
+        return _json(response)
 
 
 class MetricsMonitor:
     """WebSocket-based real-time metrics monitor"""
     
-    def __init__(self, ws_url: str = "ws://localhost:8095/ws"):
+    # Seconds between writes of buffered output to stdout
+    FLUSH_INTERVAL = 0.1
+    
+    def __init__(self, ws_url: str = "ws://localhost:8095/ws", batch: bool = False):
         """
         Initialize the metrics monitor.
         
         Args:
             ws_url: WebSocket URL for real-time metrics
+            batch: Ask the server to batch updates into 'metrics-batch' frames
         """
+        if batch:
+            ws_url += "&batch=1" if "?" in ws_url else "?batch=1"
         self.ws_url = ws_url
         self.metrics = {
             "lucidLink": None,
             "s3Health": None
         }
+        self._handlers = {
+            "metrics": self._on_metrics,
+            "lucidlink-stats": self._on_lucidlink_stats,
+            "s3-health": self._on_s3_health,
+            "metrics-batch": self._on_metrics_batch
+        }
+        self._buf: List[str] = []
     
     async def connect_and_monitor(self, duration: Optional[int] = None):
         """
@@ -228,63 +806,128 @@ class MetricsMonitor:
         Args:
             duration: Optional duration in seconds to monitor (None = forever)
         """
-        start_time = time.time()
-        
-        async with websockets.connect(self.ws_url) as websocket:
-            print(f"Connected to metrics WebSocket: {self.ws_url}")
+        # Output is buffered and written periodically rather than per message
+        flusher = asyncio.create_task(self._flush_loop())
+        try:
+            await self._receive(duration)
+        finally:
+            flusher.cancel()
+            self._flush()
+    
+    async def _receive(self, duration: Optional[int]):
+        """Receive and handle messages until the duration has elapsed"""
+        # Frames are small JSON documents: skip compression and bound the
+        # receive queue and frame size. Pinging every 15s keeps proxies with
+        # 60s idle timeouts from closing the connection and detects a dead
+        # peer within about 25s
+        async with websocket_connect(
+            self.ws_url,
+            ping_interval=15,
+            ping_timeout=10,
+            close_timeout=5,
+            max_queue=64,
+            max_size=2**20,
+            compression=None
+        ) as websocket:
+            self._emit(f"Connected to metrics WebSocket: {self.ws_url}")
             
-            while True:
-                # Check duration
-                if duration and (time.time() - start_time) > duration:
-                    break
-                
-                try:
-                    message = await asyncio.wait_for(websocket.recv(), timeout=1.0)
-                    data = json.loads(message)
+            # Wait on the next message and the deadline together instead of
+            # waking up periodically to check the elapsed time. Messages are
+            # received as raw bytes since orjson doesn't need decoded text
+            deadline = asyncio.create_task(asyncio.sleep(duration)) if duration else None
+            recv_task = asyncio.create_task(websocket.recv(decode=False))
+            
+            try:
+                while True:
+                    pending = {recv_task, deadline} if deadline else {recv_task}
+                    await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
                     
-                    # Handle different message types
-                    if data.get("type") == "metrics":
-                        # Initial full metrics
-                        self.metrics["lucidLink"] = data.get("lucidLink")
-                        self.metrics["s3Health"] = data.get("s3Health")
-                        self._display_metrics("Initial metrics received")
+                    if deadline and deadline.done():
+                        break
                     
-                    elif data.get("type") == "lucidlink-stats":
-                        # LucidLink throughput update
-                        self.metrics["lucidLink"] = data.get("lucidLink")
-                        throughput = data["lucidLink"]["throughputMbps"]
-                        print(f"LucidLink: {throughput:.2f} MB/s")
+                    try:
+                        self._handle_message(orjson.loads(recv_task.result()))
+                    except websockets.ConnectionClosed as e:
+                        self._emit(f"Connection closed: {e}")
+                        break
+                    except Exception as e:
+                        self._emit(f"Error: {e}")
                     
-                    elif data.get("type") == "s3-health":
-                        # S3 health update
-                        self.metrics["s3Health"] = data.get("s3Health")
-                        health = data["s3Health"]
-                        status = "✅" if health["isHealthy"] else "❌"
-                        print(f"S3 Health: {status} Latency: {health['latency']}ms "
-                              f"(avg: {health['averageLatency']}ms)")
-                
-                except asyncio.TimeoutError:
-                    continue
-                except Exception as e:
-                    print(f"Error: {e}")
+                    recv_task = asyncio.create_task(websocket.recv(decode=False))
+            finally:
+                recv_task.cancel()
+                if deadline:
+                    deadline.cancel()
+    
+    async def _flush_loop(self):
+        """Write buffered output every FLUSH_INTERVAL seconds"""
+        while True:
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            self._flush()
+    
+    def _flush(self):
+        """Write buffered output to stdout"""
+        if self._buf:
+            sys.stdout.write("\n".join(self._buf) + "\n")
+            self._buf.clear()
+            sys.stdout.flush()
+    
+    def _emit(self, line: str):
+        """Buffer a line of output"""
+        self._buf.append(line)
+    
+    def _handle_message(self, data: Dict[str, Any]):
+        """Dispatch a WebSocket message to the handler for its type"""
+        handler = self._handlers.get(data.get("type"))
+        if handler:
+            handler(data)
+    
+    def _on_metrics(self, data: Dict[str, Any]):
+        """Initial full metrics"""
+        self.metrics["lucidLink"] = data.get("lucidLink")
+        self.metrics["s3Health"] = data.get("s3Health")
+        self._display_metrics("Initial metrics received")
+    
+    def _on_lucidlink_stats(self, data: Dict[str, Any]):
+        """LucidLink throughput update"""
+        self.metrics["lucidLink"] = data.get("lucidLink")
+        throughput = data["lucidLink"]["throughputMbps"]
+        self._emit(f"LucidLink: {throughput:.2f} MB/s")
+    
+    def _on_s3_health(self, data: Dict[str, Any]):
+        """S3 health update"""
+        self.metrics["s3Health"] = data.get("s3Health")
+        health = data["s3Health"]
+        status = "✅" if health["isHealthy"] else "❌"
+        self._emit(f"S3 Health: {status} Latency: {health['latency']}ms "
+                    f"(avg: {health['averageLatency']}ms)")
+    
+    def _on_metrics_batch(self, data: Dict[str, Any]):
+        """Several updates collected by the server into one frame"""
+        # A bad update shouldn't take the rest of the batch with it
+        for update in data.get("updates", []):
+            try:
+                self._handle_message(update)
+            except Exception as e:
+                self._emit(f"Error: {e}")
     
     def _display_metrics(self, title: str):
         """Display current metrics"""
-        print(f"\n{title}")
-        print("-" * 50)
+        self._emit(f"\n{title}")
+        self._emit("-" * 50)
         
         if self.metrics["lucidLink"]:
             ll = self.metrics["lucidLink"]
-            print(f"LucidLink Throughput: {ll.get('throughputMbps', 0):.2f} MB/s")
+            self._emit(f"LucidLink Throughput: {ll.get('throughputMbps', 0):.2f} MB/s")
         
         if self.metrics["s3Health"]:
             s3 = self.metrics["s3Health"]
             status = "Healthy" if s3.get("isHealthy") else "Unhealthy"
-            print(f"S3 Status: {status}")
-            print(f"S3 Latency: {s3.get('latency', 'N/A')}ms")
-            print(f"S3 Avg Latency: {s3.get('averageLatency', 'N/A')}ms")
+            self._emit(f"S3 Status: {status}")
+            self._emit(f"S3 Latency: {s3.get('latency', 'N/A')}ms")
+            self._emit(f"S3 Avg Latency: {s3.get('averageLatency', 'N/A')}ms")
         
-        print("-" * 50)
+        self._emit("-" * 50)
 
 
 def format_job_status(job: Dict[str, Any]) -> str:
@@ -310,18 +953,23 @@ def main():
     """Example usage of the TeamCache client"""
     
     # Initialize client
-    client = TeamCacheClient()
+    client = TeamCacheClient(duration_model=JobDurationModel())
     
-    # Check health
+    # Health check and metrics don't depend on each other, so send them
+    # concurrently
     print("Checking API health...")
-    health = client.health_check()
+    health, metrics = asyncio.run(
+        _health_and_metrics(client.api_url, client.api_key),
+        debug=False
+    )
+    
+    # Check health
     print(f"API Status: {health['status']}")
     print(f"Database: {health['database']}")
     print()
     
     # Get current metrics
     print("Current System Metrics:")
-    metrics = client.get_metrics()
     if metrics["success"]:
         m = metrics["metrics"]
         print(f"  LucidLink: {m['lucidLink']['throughputMbps']:.2f} MB/s")
@@ -356,21 +1004,46 @@ def main():
               f"({job['completed_files']}/{job['total_files']} files)")
 
 
+async def _health_and_metrics(api_url: str, api_key: str):
+    """Fetch API health and current metrics concurrently"""
+    async with AsyncTeamCacheClient(api_url, api_key) as client:
+        async with asyncio.TaskGroup() as tg:
+            health = tg.create_task(client.health_check())
+            metrics = tg.create_task(client.get_metrics())
+    return health.result(), metrics.result()
+
+
 async def monitor_metrics_example():
     """Example of real-time metrics monitoring"""
-    monitor = MetricsMonitor()
+    monitor = MetricsMonitor(batch=True)
     
     print("Starting real-time metrics monitoring for 30 seconds...")
     await monitor.connect_and_monitor(duration=30)
     print("\nMonitoring complete!")
 
 
+def _install_event_loop_policy():
+    """
+    Use uvloop for asyncio event loops when it is available.
+    
+    Must be called before any event loop is created; loops that already
+    exist keep the default implementation.
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
-    import sys
+    _install_event_loop_policy()
     
     if len(sys.argv) > 1 and sys.argv[1] == "monitor":
         # Run WebSocket monitoring
-        asyncio.run(monitor_metrics_example())
+        asyncio.run(monitor_metrics_example(), debug=False)
     else:
         # Run standard examples
-        main()
\ No newline at end of file
+        main()
@@ -1,5 +1,6 @@
 const express = require('express');
 const cors = require('cors');
+const compression = require('compression');
 const rateLimit = require('express-rate-limit');
 const { Pool } = require('pg');
 const { v4: uuidv4 } = require('uuid');
@@ -141,9 +142,18 @@ setTimeout(connectWebSocket, 2000); // Delay to ensure backend is ready
 const wss = new WebSocket.Server({ noServer: true });
 const clients = new Set();
 
-wss.on('connection', (ws) => {
-  console.log('New dashboard client connected');
-  clients.add(ws);
+// Clients connecting with ?batch=1 receive updates collected into a single
+// 'metrics-batch' frame per interval instead of one frame per update
+const METRICS_BATCH_INTERVAL = parseInt(process.env.METRICS_BATCH_INTERVAL) || 250;
+const batchClients = new Set();
+let pendingUpdates = [];
+
+wss.on('connection', (ws, request) => {
+  const { searchParams } = new URL(request.url, 'http://localhost');
+  const batched = searchParams.get('batch') === '1';
+  
+  console.log(`New dashboard client connected${batched ? ' (batched)' : ''}`);
+  (batched ? batchClients : clients).add(ws);
   
   // Send current metrics immediately
   ws.send(JSON.stringify({
@@ -156,24 +166,48 @@ wss.on('connection', (ws) => {
   ws.on('close', () => {
     console.log('Dashboard client disconnected');
     clients.delete(ws);
+    batchClients.delete(ws);
   });
   
   ws.on('error', (error) => {
     console.error('Client WebSocket error:', error);
     clients.delete(ws);
+    batchClients.delete(ws);
   });
 });
 
-// Broadcast metrics to all connected clients
-function broadcastMetrics(type, data) {
-  const message = JSON.stringify({ type, ...data });
-  clients.forEach((client) => {
+// Send a message to every open client in a set
+function sendToClients(targets, message) {
+  targets.forEach((client) => {
     if (client.readyState === WebSocket.OPEN) {
       client.send(message);
     }
   });
 }
 
+// Broadcast metrics to all connected clients
+function broadcastMetrics(type, data) {
+  const update = { type, ...data };
+  
+  if (batchClients.size > 0) {
+    pendingUpdates.push(update);
+  }
+  if (clients.size > 0) {
+    sendToClients(clients, JSON.stringify(update));
+  }
+}
+
+// Flush pending updates to batched clients
+setInterval(() => {
+  if (pendingUpdates.length === 0) {
+    return;
+  }
+  
+  const message = JSON.stringify({ type: 'metrics-batch', updates: pendingUpdates });
+  pendingUpdates = [];
+  sendToClients(batchClients, message);
+}, METRICS_BATCH_INTERVAL);
+
 // S3 health check configuration
 const S3_BUCKET = process.env.S3_HEALTH_BUCKET || 'lucid-fs-33d44ea3-beef-4604-bd02-edfe5d4216e2';
 const S3_ENDPOINT = process.env.S3_ENDPOINT || 'https://s3.us-east-1.amazonaws.com';
@@ -295,6 +329,9 @@ const pool = new Pool({
 app.use(express.json({ limit: '10mb' }));
 app.use(cors());
 
+// Compress responses larger than 1KB for clients that accept it
+app.use(compression({ threshold: 1024 }));
+
 // Request logging middleware
 app.use((req, res, next) => {
   const timestamp = new Date().toISOString();
@@ -907,7 +944,8 @@ const server = app.listen(PORT, '0.0.0.0', async () => {
 
 // Handle WebSocket upgrade
 server.on('upgrade', (request, socket, head) => {
-  if (request.url === '/ws') {
+  const { pathname } = new URL(request.url, 'http://localhost');
+  if (pathname === '/ws') {
     wss.handleUpgrade(request, socket, head, (ws) => {
       wss.emit('connection', ws, request);
     });